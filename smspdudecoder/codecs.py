@@ -8,6 +8,7 @@ Implementation of different codecs used in SMS PDUs, according to the GSM 03.38
 from binascii import hexlify
 from binascii import unhexlify
 from bitstring import BitStream
+from typing import List
 
 __all__ = ['GSM', 'UCS2']
 
@@ -38,12 +39,15 @@ class GSM:
     CHAR_EXT = 0x1B
 
     @classmethod
-    def decode(cls, data: str, strip_padding: bool = False) -> str:
+    def decode(cls, data: str, strip_padding: bool = False, fill_bits: int = 0) -> str:
         r"""
         Returns decoded message from PDU string.
 
         When strip_padding argument equals True, checks if the last symbol is a padding character (CR) and removes it.
 
+        The fill_bits argument skips that many low-order bits of the first octet, which is how the first septet is
+        aligned when the message follows a User Data Header.
+
         For more details, read the ETSI GSM 03.38 specification (version 5.6.1) that can be found at:
         https://www.etsi.org/deliver/etsi_i_ets/300900_300999/300900/03_60/ets_300900e03p.pdf
 
@@ -64,9 +68,36 @@ class GSM:
 
         >>> GSM.decode('AA58ACA6AA8D1A', True)
         '*115*5#'
+
+        Decodes a message starting after one fill bit:
+
+        >>> GSM.decode('D06536FB0DBABFE56C32', fill_bits=1)
+        'hello world'
+        """
+        value = int.from_bytes(unhexlify(data[:len(data) & ~1]), 'little')
+        if len(data) % 2:
+            # A truncated PDU may end with half an octet
+            value |= int(data[-1], 16) << (4 * len(data) - 4)
+        # The first septet sits in the lowest bits of the little-endian value
+        septets_end = fill_bits + max(4 * len(data) - fill_bits, 0) // 7 * 7
+        septets = [(value >> shift) & 0x7F for shift in range(fill_bits, septets_end, 7)]
+        if cls.CHAR_EXT not in septets:
+            res = ''.join([cls.ALPHABET[char_index] for char_index in septets])
+        else:
+            res = cls.decode_extended(septets)
+
+        if strip_padding and len(septets) % 8 == 0 and res.endswith('\r'):
+            return res[:-1]
+        return res
+
+    @classmethod
+    def decode_extended(cls, septets: List[int]) -> str:
+        """
+        Returns decoded message from a list of septets, some of which escape to the extended table.
+
+        >>> GSM.decode_extended([0x32, 0x1B, 0x65])
+        '2€'
         """
-        reversed_bits = BitStream(hex=cls.reversed_octets(data)).bin
-        septets = [int(reversed_bits[k:k+7], 2) for k in range(len(reversed_bits)-7, -1, -7)]
         res = ''
         is_extended = False
         for char_index in septets:
@@ -78,9 +109,6 @@ class GSM:
                 res += cls.ALPHABET_EXT.get(char_index, ' ')
             else:
                 res += cls.ALPHABET[char_index]
-
-        if strip_padding and len(septets) % 8 == 0 and res.endswith('\r'):
-            return res[:-1]
         return res
 
     @classmethod
@@ -4,7 +4,7 @@
 from io import StringIO
 from typing import Any, Dict
 
-from .fields import SMSDeliver, SMSSubmit
+from .fields import InformationElement, SMSDeliver, SMSSubmit
 
 __all__ = [
     'read_incoming_sms',
@@ -23,7 +23,7 @@ def read_incoming_sms(data: str) -> Dict[str, Any]:
     partial: Any = False
     if header:
         for element in header.get('elements', list()):
-            if element['iei'] in [0x00, 0x08]:
+            if element['iei'] in InformationElement.IEI_SUPPORTED:
                 el_data = element['data']
                 partial = {
                     'reference': f"{el_data['reference']}-{el_data['parts_count']}",
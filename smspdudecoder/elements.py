@@ -10,13 +10,10 @@ All these elements are encoded in strings and decoded in native Python objects.
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
-from io import StringIO
-from typing import Dict
+from typing import Dict, Tuple
 
 import pytz
 
-from bitstring import BitStream
-
 __all__ = [
     'Date',
     'Number',
@@ -33,10 +30,33 @@ def swap_nibbles(data: str) -> str:
     >>> swap_nibbles('0123')
     '1032'
     """
-    res = ''
-    for k in range(0, len(data), 2):
-        res += data[k+1] + data[k]
-    return res
+    swapped = list(data)
+    swapped[::2], swapped[1::2] = data[1::2], data[::2]
+    return ''.join(swapped)
+
+
+class OctetTable(dict):
+    """
+    Maps every two-digit hex string, in any letter case, to its octet value.
+
+    Used instead of int(..., 16) on the hot decoding paths. Like int(), it raises a ValueError on invalid input.
+
+    >>> OCTETS['9a'], OCTETS['9A']
+    (154, 154)
+    >>> OCTETS['9']
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid hex octet: '9'
+    """
+    def __init__(self) -> None:
+        digits = '0123456789abcdefABCDEF'
+        super().__init__((high + low, int(high + low, 16)) for high in digits for low in digits)
+
+    def __missing__(self, key: str) -> int:
+        raise ValueError(f"Invalid hex octet: {key!r}")
+
+
+OCTETS = OctetTable()
 
 
 class Date:
@@ -67,19 +87,19 @@ class Date:
         >>> (Date.decode('11101131522400') - Date.decode('11101131521440')).total_seconds()
         3601.0
         """
-        io_data = StringIO(swap_nibbles(data))
-        year = 2000 + int(io_data.read(2))
-        month = int(io_data.read(2))
-        day = int(io_data.read(2))
-        hour = int(io_data.read(2))
-        minute = int(io_data.read(2))
-        second = int(io_data.read(2))
-        tz_data = int(io_data.read(2), 16)
+        digits = swap_nibbles(data)
+        year = 2000 + int(digits[0:2])
+        month = int(digits[2:4])
+        day = int(digits[4:6])
+        hour = int(digits[6:8])
+        minute = int(digits[8:10])
+        second = int(digits[10:12])
+        tz_data = OCTETS[digits[12:14]]
         tz_multiplier = -1 if tz_data & 0x80 else +1
         tz_offset_abs = int(f'{tz_data&0x7f:x}')
         tz_delta = timedelta(minutes=15*tz_multiplier*tz_offset_abs)
-        local_date = datetime(year, month, day, hour, minute, second, tzinfo=timezone(tz_delta))
-        return local_date.astimezone(timezone.utc)
+        # Subtracting the offset from the local time gives the UTC time
+        return datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc) - tz_delta
 
     @classmethod
     def encode(cls, date: datetime) -> str:
@@ -188,23 +208,24 @@ class TypeOfAddress:
         >>> TypeOfAddress.decode('91')
         {'ton': 'international', 'npi': 'isdn'}
         """
-        io_data = BitStream(hex=data)
-        first_bit = io_data.read('bool')
-        if not first_bit:
-            raise ValueError("Invalid first bit of the Type Of Address octet")
-        # Type Of Number
-        ton = cls.TON.get(io_data.read('bits:3').uint)
-        if ton is None:
-            assert False, "Type-Of-Number bits should be exaustive"
-            raise ValueError("Invalid Type Of Number bits")
-        # Numbering Plan Identification
-        npi =  cls.NPI.get(io_data.read('bits:4').uint)
-        if npi is None:
+        return cls.decode_octet(OCTETS[data])[0]
+
+    @classmethod
+    def decode_octet(cls, octet: int) -> Tuple[Dict[str, str], bool]:
+        """
+        Decodes the Type Of Address octet value. Also tells whether the address is alphanumeric.
+
+        Example:
+
+        >>> TypeOfAddress.decode_octet(0xD0)
+        ({'ton': 'alphanumeric', 'npi': 'unknown'}, True)
+        """
+        toa = _DECODED_TOA[octet]
+        if toa is None:
+            if not octet & 0x80:
+                raise ValueError("Invalid first bit of the Type Of Address octet")
             raise ValueError("Invalid Numbering Plan Identification bits")
-        return {
-            'ton': ton,
-            'npi': npi,
-        }
+        return dict(toa), _ALPHANUMERIC_TOA[octet]
 
     @classmethod
     def encode(cls, data: Dict[str, str]) -> str:
@@ -223,3 +244,14 @@ class TypeOfAddress:
         if npi is None:
             raise ValueError("Invalid Numbering Plan Identification")
         return f'{0x80 | (ton << 4) | npi:02x}'
+
+
+# Decoded Type Of Address for every octet value, or None if the octet is invalid
+_DECODED_TOA = tuple(
+    {'ton': TypeOfAddress.TON[(octet >> 4) & 0b111], 'npi': TypeOfAddress.NPI[octet & 0b1111]}
+    if octet & 0x80 and octet & 0b1111 in TypeOfAddress.NPI else None
+    for octet in range(256)
+)
+
+# Whether the Type Of Number of every octet value is alphanumeric
+_ALPHANUMERIC_TOA = tuple((octet >> 4) & 0b111 == TypeOfAddress.TON_INV['alphanumeric'] for octet in range(256))
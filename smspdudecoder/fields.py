@@ -17,12 +17,12 @@ from .codecs import GSM
 from .codecs import UCS2
 from .elements import Date
 from .elements import Number
+from .elements import OCTETS
 from .elements import TypeOfAddress
 from binascii import unhexlify
-from bitstring import BitStream
 from io import StringIO
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List
 
 
 class Address:
@@ -49,10 +49,10 @@ class Address:
         >>> Address.decode(StringIO('14D0C4F23C7D760390EF7619'))
         {'length': 20, 'toa': {'ton': 'alphanumeric', 'npi': 'unknown'}, 'number': 'Design@Home'}
         """
-        length = int(pdu_data.read(2), 16)
-        toa = TypeOfAddress.decode(pdu_data.read(2))
+        length = OCTETS[pdu_data.read(2)]
+        toa, is_alphanumeric = TypeOfAddress.decode_octet(OCTETS[pdu_data.read(2)])
         encoded_number = pdu_data.read(length + length % 2)
-        if toa['ton'] == 'alphanumeric':
+        if is_alphanumeric:
             number = GSM.decode(encoded_number)
         else:
             number = Number.decode(encoded_number)
@@ -67,6 +67,13 @@ class SMSC:
     """
     SMS-C datagram.
     """
+    # Result when the SMS-C information is not included, copied rather than rebuilt on each call
+    _EMPTY = {
+        'length': 0,
+        'toa': None,
+        'number': None,
+    }
+
     @classmethod
     def decode(cls, pdu_data: StringIO):
         """
@@ -76,18 +83,19 @@ class SMSC:
 
         >>> SMSC.decode(StringIO('07912299976758F2'))
         {'length': 7, 'toa': {'ton': 'international', 'npi': 'isdn'}, 'number': '22997976852'}
+
+        The SMS-C information may be omitted:
+
+        >>> SMSC.decode(StringIO('00'))
+        {'length': 0, 'toa': None, 'number': None}
         """
-        length = int(pdu_data.read(2), 16)
+        length = OCTETS[pdu_data.read(2)]
         if not length:
-            return {
-                'length': 0,
-                'toa': None,
-                'number': None,
-            }
+            return cls._EMPTY.copy()
 
-        toa = TypeOfAddress.decode(pdu_data.read(2))
+        toa, is_alphanumeric = TypeOfAddress.decode_octet(OCTETS[pdu_data.read(2)])
         encoded_number = pdu_data.read(2*(length-1))
-        if toa['ton'] == 'alphanumeric':
+        if is_alphanumeric:
             number = GSM.decode(encoded_number)
         else:
             number = Number.decode(encoded_number)
@@ -102,12 +110,9 @@ class PDUHeader:
     """
     Describes the incomming TPDU header of SM-TP
     """
-    MTI = {
-        0b00: 'deliver',
-        0b01: 'submit-report',
-        0b10: 'status-report',
-    }
-    MTI_INV = dict([(v[1], v[0]) for v in MTI.items()])
+    # Indexed by the Message Type Indicator bits, 0b11 is reserved
+    MTI = ('deliver', 'submit-report', 'status-report', None)
+    MTI_INV = dict([(v[1], v[0]) for v in enumerate(MTI) if v[1] is not None])
 
     @classmethod
     def decode(cls, pdu_data: StringIO) -> Dict[str, Any]:
@@ -117,35 +122,33 @@ class PDUHeader:
         >>> PDUHeader.decode(StringIO('44'))
         {'rp': False, 'udhi': True, 'sri': False, 'lp': False, 'mms': True, 'mti': 'deliver'}
         """
-        result = dict()
-        io_data = BitStream(hex=pdu_data.read(2))
-        # Reply Path
-        result['rp'] = io_data.read('bool')
-        # User Data PDUHeader Indicator
-        result['udhi'] = io_data.read('bool')
-        # Status Report Indication
-        result['sri'] = io_data.read('bool'); io_data.pos += 1 # skips a bit
-        # Loop Prevention
-        result['lp'] = io_data.read('bool')
-        # More Messages to Send
-        result['mms'] = io_data.read('bool')
-        # Message Type Indicator
-        result['mti'] = cls.MTI.get(io_data.read('bits:2').uint)
-        if result['mti'] is None:
+        header = OCTETS[pdu_data.read(2)]
+        mti = cls.MTI[header & 0b11]
+        if mti is None:
             raise ValueError("Invalid Message Type Indicator")
-        return result
+        return {
+            # Reply Path
+            'rp': bool(header & 0x80),
+            # User Data PDUHeader Indicator
+            'udhi': bool(header & 0x40),
+            # Status Report Indication
+            'sri': bool(header & 0x20),
+            # Loop Prevention
+            'lp': bool(header & 0x08),
+            # More Messages to Send
+            'mms': bool(header & 0x04),
+            # Message Type Indicator
+            'mti': mti,
+        }
 
 
 class OutgoingPDUHeader:
     """
     Describes the outgoing TPDU header of SM-TP
     """
-    MTI = {
-        0b00: 'deliver',
-        0b01: 'submit',
-        0b10: 'status',
-    }
-    MTI_INV = dict([(v[1], v[0]) for v in MTI.items()])
+    # Indexed by the Message Type Indicator bits, 0b11 is reserved
+    MTI = ('deliver', 'submit', 'status', None)
+    MTI_INV = dict([(v[1], v[0]) for v in enumerate(MTI) if v[1] is not None])
 
     @classmethod
     def decode(cls, pdu_data: StringIO) -> Dict[str, Any]:
@@ -155,65 +158,75 @@ class OutgoingPDUHeader:
         >>> OutgoingPDUHeader.decode(StringIO('11'))
         {'rp': False, 'udhi': False, 'srr': False, 'vpf': 2, 'rd': False, 'mti': 'submit'}
         """
-        result = dict()
-        io_data = BitStream(hex=pdu_data.read(2))
-        # Reply Path
-        result['rp'] = io_data.read('bool')
-        # User Data Header Indicator
-        result['udhi'] = io_data.read('bool')
-        # Status Report Request
-        result['srr'] = io_data.read('bool')
-        # Validity Period Format
-        result['vpf'] = io_data.read('bits:2').uint
-        # Reject Duplicates
-        result['rd'] = io_data.read('bool')
-        # Message Type Indicator
-        result['mti'] = cls.MTI.get(io_data.read('bits:2').uint)
-        if result['mti'] is None:
+        header = OCTETS[pdu_data.read(2)]
+        mti = cls.MTI[header & 0b11]
+        if mti is None:
             raise ValueError("Invalid Message Type Indicator")
-        return result
+        return {
+            # Reply Path
+            'rp': bool(header & 0x80),
+            # User Data Header Indicator
+            'udhi': bool(header & 0x40),
+            # Status Report Request
+            'srr': bool(header & 0x20),
+            # Validity Period Format
+            'vpf': (header >> 3) & 0b11,
+            # Reject Duplicates
+            'rd': bool(header & 0x04),
+            # Message Type Indicator
+            'mti': mti,
+        }
 
 
 class DCS:
     """
     Data Coding Scheme (simplified, only the encoding is read)
     """
+    # Encoding for every DCS octet value, given by its bits 3-2
+    ENCODINGS = tuple(('gsm', 'binary', 'ucs2', 'gsm')[(dcs & 0b1100) >> 2] for dcs in range(256))
+
     @classmethod
     def decode(cls, pdu_data: StringIO) -> Dict[str, str]:
-        dcs = int(pdu_data.read(2), 16)
-        coding = (dcs & 0b1100) >> 2
-        if coding == 1:
-            return {'encoding': 'binary'}
-        elif coding == 2:
-            return {'encoding': 'ucs2'}
-        else:
-            return {'encoding': 'gsm'}
+        """
+        Decodes the encoding from the Data Coding Scheme octet.
+
+        >>> DCS.decode(StringIO('08'))
+        {'encoding': 'ucs2'}
+        """
+        return {'encoding': cls.ENCODINGS[OCTETS[pdu_data.read(2)]]}
 
 
 class InformationElement:
     @staticmethod
     def concatenated_sms(data: str, length_bits: int = 8) -> Dict[str, Any]:
-        io_data = BitStream(hex=data)
+        """
+        Decodes a concatenated short message IE, with a reference number of length_bits bits.
+
+        >>> InformationElement.concatenated_sms('AB0201')
+        {'reference': 171, 'parts_count': 2, 'part_number': 1}
+        >>> InformationElement.concatenated_sms('00AB0201', 16)
+        {'reference': 171, 'parts_count': 2, 'part_number': 1}
+        """
+        reference_end = length_bits // 4
         return {
-            'reference': io_data.read(f'uintbe:{length_bits}'),
-            'parts_count': io_data.read('uintbe:8'),
-            'part_number': io_data.read('uintbe:8'),
+            'reference': int(data[:reference_end], 16),
+            'parts_count': OCTETS[data[reference_end:reference_end+2]],
+            'part_number': OCTETS[data[reference_end+2:reference_end+4]],
         }
 
-    IEI = {
-        0x00: lambda v: InformationElement.concatenated_sms(v, 8),
-        0x08: lambda v: InformationElement.concatenated_sms(v, 16),
-    }
+    # Information Element Identifiers whose data is decoded (concatenated SMS)
+    IEI_SUPPORTED = frozenset({0x00, 0x08})
 
     @classmethod
     def decode(cls, pdu_data: StringIO) -> Dict[str, Any]:
-        iei = int(pdu_data.read(2), 16)
-        length = int(pdu_data.read(2), 16)
+        iei = OCTETS[pdu_data.read(2)]
+        length = OCTETS[pdu_data.read(2)]
         data = pdu_data.read(2*length)
-        processing_func = cls.IEI.get(iei)
         processed_data: Any = data
-        if processing_func is not None:
-            processed_data = processing_func(data)
+        if iei == 0x00:
+            processed_data = cls.concatenated_sms(data, 8)
+        elif iei == 0x08:
+            processed_data = cls.concatenated_sms(data, 16)
         return {
             'iei': iei,
             'length': length,
@@ -224,11 +237,27 @@ class InformationElement:
 class UserDataHeader:
     @classmethod
     def decode(cls, pdu_data: StringIO) -> Dict[str, Any]:
-        length = int(pdu_data.read(2), 16)
-        final_position = pdu_data.tell() + 2 * length
-        elements = list()
-        while pdu_data.tell() < final_position:
-            elements.append(InformationElement.decode(pdu_data))
+        """
+        Decodes a User Data Header and its information elements.
+
+        >>> UserDataHeader.decode(StringIO('050003AB0201'))
+        {'length': 5, 'elements': [{'iei': 0, 'length': 3, 'data': {'reference': 171, 'parts_count': 2, 'part_number': 1}}]}
+        """
+        length = OCTETS[pdu_data.read(2)]
+        if not length:
+            return {
+                'length': 0,
+                'elements': [],
+            }
+        header_hex = pdu_data.read(2 * length)
+        if len(header_hex) < 2 * length:
+            raise ValueError("Truncated PDU: User Data Header is shorter than specified by UDHL.")
+        # Elements are read from the header's own buffer, so a malformed one can't run into the message
+        header_data = StringIO(header_hex)
+        # Headers usually hold a single element, typically the concatenated SMS reference
+        elements = [InformationElement.decode(header_data)]
+        while header_data.tell() < len(header_hex):
+            elements.append(InformationElement.decode(header_data))
         return {
             'length': length,
             'elements': elements,
@@ -238,24 +267,25 @@ class UserDataHeader:
 class UserData:
     @classmethod
     def decode(cls, pdu_data: StringIO, ctx: dict = None):
-        length = int(pdu_data.read(2), 16)
-        pdu_start = pdu_data.tell()
+        length = OCTETS[pdu_data.read(2)]
         header, header_length = None, 0
         warning = None
         if ctx['header']['udhi']:
             header = UserDataHeader.decode(pdu_data)
             header_length = header['length'] + 1
         data: Any = None
-        if ctx['dcs']['encoding'] == 'binary':
-            data = unhexlify(pdu_data.read(2*(length-header_length)))
-        elif ctx['dcs']['encoding'] == 'gsm':
-            pdu_data.seek(pdu_start)
+        # Most messages are GSM encoded, so it is tested first
+        encoding = ctx['dcs']['encoding']
+        if encoding == 'gsm':
+            # The header occupies whole septets, the message starts after the fill bits
             header_length_bits = header_length * 8
-            header_length_septets = int(header_length_bits / 7) + (1 if header_length_bits % 7 else 0)
+            header_length_septets = (header_length_bits + 6) // 7
+            fill_bits = header_length_septets * 7 - header_length_bits
             data_length_bits = length * 7
-            data_length_bytes = int(data_length_bits / 8) + (1 if data_length_bits % 8 else 0)
-            data = GSM.decode(pdu_data.read(2*data_length_bytes))[header_length_septets:length]
-        elif ctx['dcs']['encoding'] == 'ucs2':
+            data_length_bytes = (data_length_bits + 7) // 8
+            body_length_bytes = max(data_length_bytes - header_length, 0)
+            data = GSM.decode(pdu_data.read(2*body_length_bytes), fill_bits=fill_bits)[:length-header_length_septets]
+        elif encoding == 'ucs2':
             expected_hex_len = 2 * (length - header_length)
             hex_data = pdu_data.read(expected_hex_len)
 
@@ -265,11 +295,12 @@ class UserData:
                 warning = "Truncated PDU: User data is shorter than specified by UDL."
                 logger.warning(warning)
 
-                # Truncates to the last full character
-                trunc_len = len(hex_data) - (len(hex_data) % 4)
-                data = UCS2.decode(hex_data[:trunc_len]) + '…'
+                # Truncates to the last full character (4 hex digits)
+                data = UCS2.decode(hex_data[:len(hex_data) & ~3]) + '…'
             else:
                 data = UCS2.decode(hex_data)
+        elif encoding == 'binary':
+            data = unhexlify(pdu_data.read(2*(length-header_length)))
         else:
             raise AssertionError("Non-recognized encoding")
 
@@ -288,45 +319,65 @@ class SMSDeliver:
         """
         Decodes an SMS-DELIVER TP-DU.
         """
-        result = dict()
-        result['smsc'] = SMSC.decode(pdu_data)
-        result['header'] = PDUHeader.decode(pdu_data)
-        result['sender'] = Address.decode(pdu_data)
-        result['pid'] = int(pdu_data.read(2), 16)
-        result['dcs'] = DCS.decode(pdu_data)
-        result['scts'] = Date.decode(pdu_data.read(2*7))
+        result = {
+            'smsc': SMSC.decode(pdu_data),
+            'header': PDUHeader.decode(pdu_data),
+            'sender': Address.decode(pdu_data),
+            'pid': OCTETS[pdu_data.read(2)],
+            'dcs': DCS.decode(pdu_data),
+            'scts': Date.decode(pdu_data.read(2*7)),
+        }
         result['user_data'] = UserData.decode(pdu_data, result)
         return result
 
+    @classmethod
+    def decode_many(cls, pdus: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Decodes SMS-DELIVER TP-DUs from PDU hex strings, and returns them in the same order.
+
+        >>> messages = SMSDeliver.decode_many([
+        ...     '07916407058099F9040B916407950303F100008921222140140004D4E2940A',
+        ...     '00440B915155214365F700007040213252240012050003AB0201D06536FB0DBABFE56C32',
+        ... ])
+        >>> [sms['user_data']['data'] for sms in messages]
+        ['TEST', 'hello world']
+        """
+        decode = cls.decode
+        return [decode(StringIO(pdu)) for pdu in pdus]
+
 
 class SMSSubmit:
     """
     SMS-SUBMIT TP-DU.
     """
+    # Relative validity period as a (key, value) pair, for every TP-VP octet value
+    RELATIVE_VALIDITY = tuple(
+        ('validity-minutes', vp * 5) if vp <= 143 else
+        ('validity-hours', 12 + (vp - 143) // 2) if vp <= 167 else
+        ('validity-days', vp - 166) if vp <= 196 else
+        ('validity-weeks', vp - 192)
+        for vp in range(256)
+    )
+
     @classmethod
     def decode(cls, pdu_data: StringIO):
         """
         Decodes an SMS-SUBMIT TP-DU.
         """
-        result = dict()
-        result['smsc'] = SMSC.decode(pdu_data)
-        result['header'] = OutgoingPDUHeader.decode(pdu_data)
-        result['message-ref'] = int(pdu_data.read(2), 16)
-        result['recipient'] = Address.decode(pdu_data)
-        result['pid'] = int(pdu_data.read(2), 16)
-        result['dcs'] = DCS.decode(pdu_data)
+        result = {
+            'smsc': SMSC.decode(pdu_data),
+            'header': OutgoingPDUHeader.decode(pdu_data),
+            'message-ref': OCTETS[pdu_data.read(2)],
+            'recipient': Address.decode(pdu_data),
+            'pid': OCTETS[pdu_data.read(2)],
+            'dcs': DCS.decode(pdu_data),
+        }
         if result['header']['vpf'] == 0:
             pass
         elif result['header']['vpf'] == 2:
-            result['vp'] = int(pdu_data.read(2), 16)
-            if result['vp'] <= 143:
-                result['validity-minutes'] = result['vp'] * 5
-            elif result['vp'] <= 167:
-                result['validity-hours'] = 12 + (result['vp'] - 143) // 2
-            elif result['vp'] <= 196:
-                result['validity-days'] = result['vp'] - 166
-            else:
-                result['validity-weeks'] = result['vp'] - 192
+            result['vp'] = OCTETS[pdu_data.read(2)]
+            validity_key, validity = cls.RELATIVE_VALIDITY[result['vp']]
+            result[validity_key] = validity
         elif result['header']['vpf'] == 3:
             result['vp'] = Date.decode(pdu_data.read(2*7))
         else:
@@ -334,3 +385,18 @@ class SMSSubmit:
 
         result['user_data'] = UserData.decode(pdu_data, result)
         return result
+
+    @classmethod
+    def decode_many(cls, pdus: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Decodes SMS-SUBMIT TP-DUs from PDU hex strings, and returns them in the same order.
+
+        >>> messages = SMSSubmit.decode_many([
+        ...     '0011000B915155214365F70000AA05E8329BFD06',
+        ...     '0001000B916407281553F800000AE8329BFD4697D9EC37',
+        ... ])
+        >>> [sms['user_data']['data'] for sms in messages]
+        ['hello', 'hellohello']
+        """
+        decode = cls.decode
+        return [decode(StringIO(pdu)) for pdu in pdus]
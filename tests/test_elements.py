@@ -36,3 +36,8 @@ class TypeOfAddressTestCase(unittest.TestCase):
     def test_encode_invalid_dict(self):
         with self.assertRaises(ValueError):
             TypeOfAddress.encode({})
+
+    def test_decode_returns_new_dict(self):
+        toa = TypeOfAddress.decode('91')
+        toa['ton'] = 'national'
+        self.assertEqual(TypeOfAddress.decode('91'), {'ton': 'international', 'npi': 'isdn'})
@@ -2,6 +2,7 @@ import unittest
 from io import StringIO
 
 from smspdudecoder.fields import SMSDeliver
+from smspdudecoder.fields import UserDataHeader
 
 
 class SMSDeliverTestCase(unittest.TestCase):
@@ -16,3 +17,50 @@ class SMSDeliverTestCase(unittest.TestCase):
 
         # Check for the presence of a warning
         self.assertIn('warning', decoded_data['user_data'])
+
+    def test_decode_gsm_with_udh(self):
+        pdu = '00440B915155214365F700007040213252240012050003AB0201D06536FB0DBABFE56C32'
+
+        decoded_data = SMSDeliver.decode(StringIO(pdu))
+
+        self.assertEqual(decoded_data['user_data']['data'], "hello world")
+        self.assertEqual(decoded_data['user_data']['header']['elements'][0]['data'], {
+            'reference': 0xAB,
+            'parts_count': 2,
+            'part_number': 1,
+        })
+
+    def test_decode_gsm_with_udh_escape_septet(self):
+        # The header octets contain an escape septet (0x1B), which must not swallow the first character
+        pdu = '00400B915155214365F70000704021325224001A050003D5096CB065F2991C1E97C59BF2A60C8AC9B43219'
+
+        decoded_data = SMSDeliver.decode(StringIO(pdu))
+
+        self.assertEqual(decoded_data['user_data']['data'], "Xedgdaceb€€ 12Z22")
+
+    def test_decode_udh_overlong_element(self):
+        # The element claims 5 octets while the header only holds 2 of them
+        pdu = '00440B915155214365F700087040213252240009042405010200480069'
+
+        decoded_data = SMSDeliver.decode(StringIO(pdu))
+
+        self.assertEqual(decoded_data['user_data']['header']['elements'], [
+            {'iei': 0x24, 'length': 5, 'data': '0102'},
+        ])
+        self.assertEqual(decoded_data['user_data']['data'], "Hi")
+
+
+class UserDataHeaderTestCase(unittest.TestCase):
+    def test_decode_truncated_after_element(self):
+        with self.assertRaises(ValueError):
+            UserDataHeader.decode(StringIO('0A0003AB0201'))
+
+    def test_decode_truncated_element(self):
+        with self.assertRaises(ValueError):
+            UserDataHeader.decode(StringIO('0A2405AB'))
+        with self.assertRaises(ValueError):
+            UserDataHeader.decode(StringIO('0A0003AB'))
+
+    def test_decode_truncated_pdu(self):
+        with self.assertRaises(ValueError):
+            SMSDeliver.decode(StringIO('00440B915155214365F700007040213252240012052405AB'))